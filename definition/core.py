@@ -5,14 +5,29 @@ import asyncio
 import re
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Set, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 from datetime import datetime
 import aiohttp
-from bs4 import BeautifulSoup
+from aiohttp.resolver import AsyncResolver
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from pybloom_live import ScalableBloomFilter
+import xxhash
 import aiomysql
 from email_validator import validate_email, EmailNotValidError
 
+try:
+    import hyperscan
+except ImportError:  # No wheel for this platform; fall back to re
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # Same compile/findall/sub API, backtracking engine
+    re2 = re
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +36,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _strip_www(netloc: str) -> str:
+    """Lowercase a netloc and drop a leading 'www.'."""
+    return netloc.lower().removeprefix('www.')
+
+
 class EmailExtractor:
     """Core email extraction engine with maximum concurrency."""
     
@@ -31,26 +51,90 @@ class EmailExtractor:
         '/company', '/staff', '/people', '/leadership',
         '/contact-us', '/about-us', '/our-team', '/meet-the-team'
     ]
+    EMAIL_PATHS_PATTERN = re.compile(
+        '|'.join(re.escape(path) for path in EMAIL_PATHS), re.I
+    )
+    
+    # Non-HTML resources skipped while crawling (tuple for str.endswith)
+    EXCLUDED_EXTENSIONS = (
+        '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css',
+        '.js', '.ico', '.svg', '.zip', '.mp4', '.mp3',
+        '.avi', '.mov', '.wmv', '.flv', '.webm',
+        '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+        '.exe', '.dmg', '.apk', '.deb', '.rpm'
+    )
+    # Same check on a raw href, before it is resolved. The scheme and
+    # authority are consumed possessively so only the path is tested
+    # (https://example.zip is kept), and the extension must end the path.
+    EXCLUDED_LINK_PATTERN = re.compile(
+        r'(?:[a-z][a-z0-9+.-]*:)?+(?://[^/?#]*)?+[^?#]*\.(?:'
+        + '|'.join(re.escape(ext[1:]) for ext in EXCLUDED_EXTENSIONS)
+        + r')(?:[?#]|\Z)',
+        re.I
+    )
+    
+    # Links resolvable without urljoin: optional http(s) authority, a
+    # path without params, then an optional query/fragment
+    SIMPLE_LINK_PATTERN = re.compile(
+        r'(?:(?:(https?):)?//([^/?#\s\\]+))?([^?#\s\\;:]*)(?:[?#].*)?', re.S
+    )
+    # Paths urljoin rewrites: dot segments, and empty segments, which it
+    # drops when merging a relative path
+    REWRITTEN_PATH_PATTERN = re.compile(r'(?:^|/)\.\.?(?:/|$)|//')
+    
+    # Maximum bytes of a page body read for extraction
+    MAX_PAGE_BYTES = 1048576
+    
+    # Page rows per batched INSERT
+    PAGE_WRITE_BATCH = 500
+    
+    # Concurrent page fetches per domain crawl
+    PAGE_CONCURRENCY = 50
+    
+    # URLs tracked in an exact set per crawl before switching to a
+    # Bloom filter
+    VISITED_EXACT_LIMIT = 100000
     
     # Email regex patterns - comprehensive
-    EMAIL_PATTERN = re.compile(
-        r'\b[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9][A-Za-z0-9.-]*\.[A-Z|a-z]{2,}\b'
+    EMAIL_REGEX = r'\b[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9][A-Za-z0-9.-]*\.[A-Z|a-z]{2,}\b'
+    EMAIL_PATTERN = re2.compile(EMAIL_REGEX)
+    
+    # Plain ASCII addresses that can skip email-validator: dot-separated
+    # local part of at most 64 chars, LDH domain labels, alphabetic TLD
+    SIMPLE_EMAIL_PATTERN = re.compile(
+        r'(?=[^@]{1,64}@)[a-z0-9%+_-]+(?:\.[a-z0-9%+_-]+)*@'
+        r'(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}'
     )
     
-    # Obfuscated email patterns
-    OBFUSCATED_PATTERNS = [
-        # [at] and [dot] patterns
-        (re.compile(r'([A-Za-z0-9._%+-]+)\s*\[at\]\s*([A-Za-z0-9.-]+)\s*\[dot\]\s*([A-Za-z]{2,})', re.I), r'\1@\2.\3'),
-        (re.compile(r'([A-Za-z0-9._%+-]+)\s*\(at\)\s*([A-Za-z0-9.-]+)\s*\(dot\)\s*([A-Za-z]{2,})', re.I), r'\1@\2.\3'),
-        (re.compile(r'([A-Za-z0-9._%+-]+)\s*\[AT\]\s*([A-Za-z0-9.-]+)\s*\[DOT\]\s*([A-Za-z]{2,})'), r'\1@\2.\3'),
-        # @ with spaces around it
-        (re.compile(r'([A-Za-z0-9._%+-]+)\s*@\s*([A-Za-z0-9.-]+)\s*\.\s*([A-Za-z]{2,})'), r'\1@\2.\3'),
-        # (a) and (dot) patterns
-        (re.compile(r'([A-Za-z0-9._%+-]+)\s*\(a\)\s*([A-Za-z0-9.-]+)\s*\(dot\)\s*([A-Za-z]{2,})', re.I), r'\1@\2.\3'),
-    ]
+    # Special-use TLDs that email-validator rejects
+    SPECIAL_USE_TLDS = frozenset({
+        'arpa', 'invalid', 'local', 'localhost', 'onion', 'test'
+    })
+    
+    # Obfuscated email patterns, combined into one alternation so the page
+    # text is scanned once. Each "at" separator only pairs with its own
+    # "dot" separator, so prose like "clause (a) above. The" is left alone:
+    #   user [at] domain [dot] com
+    #   user (at) domain (dot) com, user (a) domain (dot) com
+    #   user @ domain . com
+    # The domain is captured by group 2, 3 or 4 depending on the pairing.
+    OBFUSCATED_PATTERN = re2.compile(
+        r'(?i)([A-Za-z0-9._%+-]+)\s*(?:'
+        r'\[at\]\s*([A-Za-z0-9.-]+)\s*\[dot\]'
+        r'|\(at?\)\s*([A-Za-z0-9.-]+)\s*\(dot\)'
+        r'|@\s*([A-Za-z0-9.-]+)\s*\.'
+        r')\s*([A-Za-z]{2,})'
+    )
+    
+    # Separators of OBFUSCATED_PATTERN other than '@', and '@' written as
+    # an HTML entity (decoded only once the page is parsed)
+    OBFUSCATED_HINT_PATTERN = re.compile(
+        r'\[at\]|\(at?\)|&#0*64;|&#x0*40;|&commat;', re.I
+    )
     
     def __init__(self, db_config: dict, max_depth: int = 3, 
-                 timeout: int = 30, max_concurrent: int = 1000):
+                 timeout: int = 30, max_concurrent: int = 1000,
+                 db_pool_size: int = 100, parse_workers: Optional[int] = None):
         """
         Initialize the email extractor.
         
@@ -59,13 +143,21 @@ class EmailExtractor:
             max_depth: Maximum crawl depth
             timeout: HTTP request timeout in seconds
             max_concurrent: Maximum concurrent requests
+            db_pool_size: Maximum database connections
+            parse_workers: HTML parse processes (default: CPU count)
         """
         self.db_config = db_config
         self.max_depth = max_depth
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_concurrent = max_concurrent
+        self.db_pool_size = db_pool_size
+        self.parse_workers = parse_workers or os.cpu_count()
         self.db_pool = None
         self.session = None
+        self.page_queue = None
+        self.page_writer = None
+        self.parse_pool = None
+        self.email_db = self._compile_email_db()
         
     async def initialize(self):
         """Initialize database pool and HTTP session."""
@@ -77,15 +169,19 @@ class EmailExtractor:
                 password=self.db_config['password'],
                 db=self.db_config['database'],
                 autocommit=True,
-                maxsize=100,
-                charset='utf8mb4'
+                maxsize=self.db_pool_size,
+                charset='utf8mb4',
+                # UTC sessions, matching the API's created_at timestamps
+                init_command="SET time_zone='+00:00'"
             )
             
             # Create HTTP session with unbounded connections
             connector = aiohttp.TCPConnector(
                 limit=0,  # Unbounded connections
                 limit_per_host=50,
-                ttl_dns_cache=300,
+                ttl_dns_cache=600,
+                use_dns_cache=True,
+                resolver=AsyncResolver(),  # aiodns instead of getaddrinfo threads
                 ssl=False  # Disable SSL verification for speed
             )
             
@@ -93,27 +189,137 @@ class EmailExtractor:
                 connector=connector,
                 timeout=self.timeout,
                 headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                    'Accept-Encoding': 'gzip, deflate, br'  # br decoded via Brotli
                 }
             )
             
+            # Single writer that batches page rows from all crawls
+            self.page_queue = asyncio.Queue()
+            self.page_writer = asyncio.create_task(self._write_pages())
+            
+            # HTML parsing is CPU-bound; keep it off the event loop
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            
             logger.info(f"Email extractor initialized: max_depth={self.max_depth}, max_concurrent={self.max_concurrent}")
             
         except Exception as e:
             logger.error(f"Failed to initialize: {e}")
             raise
     
-    async def cleanup(self):
-        """Cleanup resources."""
+    def _compile_email_db(self):
+        """
+        Compile EMAIL_REGEX into a Hyperscan database.
+        
+        Returns:
+            Hyperscan database, or None if Hyperscan is unavailable
+        """
+        if hyperscan is None:
+            return None
+        
         try:
-            if self.session:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[self.EMAIL_REGEX.encode()],
+                ids=[0],
+                elements=1,
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST]
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Hyperscan unavailable, using re for email scan: {e}")
+            return None
+    
+    async def _write_pages(self):
+        """
+        Insert queued page rows in batches of up to PAGE_WRITE_BATCH.
+        
+        The queue carries page row tuples and flush futures; a future is
+        resolved once every row queued before it has been written.
+        """
+        while True:
+            rows = []
+            waiters = []
+            item = await self.page_queue.get()
+            while True:
+                if isinstance(item, asyncio.Future):
+                    waiters.append(item)
+                else:
+                    rows.append(item)
+                if len(rows) >= self.PAGE_WRITE_BATCH or self.page_queue.empty():
+                    break
+                item = self.page_queue.get_nowait()
+            
+            if rows:
+                try:
+                    async with self.db_pool.acquire() as conn:
+                        async with conn.cursor() as cursor:
+                            # executemany rewrites a plain INSERT ... VALUES
+                            # (...) into multi-row statements, so keep the
+                            # statement in that form
+                            await cursor.executemany(
+                                """INSERT INTO pages (domain_id, url, status_code,
+                                   content_type, error_message, etag,
+                                   last_modified, body_hash)
+                                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                                   ON DUPLICATE KEY UPDATE
+                                   status_code=VALUES(status_code),
+                                   content_type=VALUES(content_type),
+                                   error_message=VALUES(error_message),
+                                   etag=VALUES(etag),
+                                   last_modified=VALUES(last_modified),
+                                   body_hash=VALUES(body_hash),
+                                   crawled_at=NOW()""",
+                                rows
+                            )
+                except Exception as e:
+                    logger.error(f"Failed to store {len(rows)} page records: {e}")
+            
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+    
+    async def flush_pages(self):
+        """Wait until all page rows queued so far have been written."""
+        flushed = asyncio.get_running_loop().create_future()
+        self.page_queue.put_nowait(flushed)
+        await flushed
+    
+    async def cleanup(self):
+        """
+        Cleanup resources.
+        
+        Each resource is released on its own, so an error closing one
+        (typically the aiohttp session) does not leave the others open.
+        """
+        if self.page_writer:
+            self.page_writer.cancel()
+            await asyncio.gather(self.page_writer, return_exceptions=True)
+            self.page_writer = None
+        
+        if self.parse_pool:
+            try:
+                self.parse_pool.shutdown(wait=False, cancel_futures=True)
+            except Exception as e:
+                logger.error(f"Error shutting down parse pool: {e}")
+            self.parse_pool = None
+        
+        if self.session:
+            try:
                 await self.session.close()
-            if self.db_pool:
+            except Exception as e:
+                logger.error(f"Error closing HTTP session: {e}")
+            self.session = None
+        
+        if self.db_pool:
+            try:
                 self.db_pool.close()
                 await self.db_pool.wait_closed()
-            logger.info("Cleanup completed")
-        except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            except Exception as e:
+                logger.error(f"Error closing database pool: {e}")
+            self.db_pool = None
+        
+        logger.info("Cleanup completed")
     
     def normalize_url(self, url: str) -> str:
         """
@@ -135,7 +341,7 @@ class EmailExtractor:
         try:
             parsed = urlparse(url)
             # Remove www. for consistency and lowercase
-            netloc = parsed.netloc.lower().replace('www.', '')
+            netloc = _strip_www(parsed.netloc)
             
             # Remove trailing slash from path
             path = parsed.path.rstrip('/') or '/'
@@ -162,7 +368,7 @@ class EmailExtractor:
         """
         try:
             parsed = urlparse(url)
-            return parsed.netloc.lower().replace('www.', '')
+            return _strip_www(parsed.netloc)
         except:
             return ""
     
@@ -179,65 +385,130 @@ class EmailExtractor:
         """
         try:
             parsed = urlparse(url)
-            
-            # Must have scheme and netloc
-            if not parsed.scheme or not parsed.netloc:
-                return False
-            
-            # Extract domain
-            url_domain = parsed.netloc.lower().replace('www.', '')
-            
-            # Must be same domain or subdomain
-            if url_domain != base_domain and not url_domain.endswith('.' + base_domain):
-                return False
-            
-            # Exclude common non-HTML resources
-            excluded_extensions = {
-                '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css', 
-                '.js', '.ico', '.svg', '.zip', '.mp4', '.mp3',
-                '.avi', '.mov', '.wmv', '.flv', '.webm',
-                '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-                '.exe', '.dmg', '.apk', '.deb', '.rpm'
-            }
-            
-            path_lower = parsed.path.lower()
-            if any(path_lower.endswith(ext) for ext in excluded_extensions):
-                return False
-            
-            return True
-            
+            return self._is_valid_parts(
+                parsed.scheme, parsed.netloc, parsed.path, base_domain
+            )
         except Exception as e:
             logger.debug(f"URL validation failed for {url}: {e}")
             return False
     
-    async def fetch_page(self, url: str) -> Tuple[Optional[str], int]:
+    def _is_valid_parts(self, scheme: str, netloc: str, path: str,
+                        base_domain: str) -> bool:
+        """
+        Check an already-split URL; see is_valid_url.
+        
+        Args:
+            scheme: URL scheme
+            netloc: URL network location
+            path: URL path
+            base_domain: Base domain to compare against
+            
+        Returns:
+            True if valid, False otherwise
+        """
+        # Must have scheme and netloc
+        if not scheme or not netloc:
+            return False
+        
+        # Extract domain
+        url_domain = _strip_www(netloc)
+        
+        # Must be same domain or subdomain
+        if url_domain != base_domain and not url_domain.endswith('.' + base_domain):
+            return False
+        
+        # Exclude common non-HTML resources
+        if path.lower().endswith(self.EXCLUDED_EXTENSIONS):
+            return False
+        
+        return True
+    
+    async def fetch_page(self, url: str, headers: Optional[dict] = None
+                         ) -> Tuple[Optional[str], int, Tuple]:
         """
         Fetch page content asynchronously.
         
         Args:
             url: URL to fetch
+            headers: Extra request headers, e.g. conditional GET validators
             
         Returns:
-            Tuple of (html_content, status_code)
+            Tuple of (html_content, status_code, (etag, last_modified, body_hash))
         """
+        validators = (None, None, None)
         try:
-            async with self.session.get(url, allow_redirects=True, ssl=False) as response:
+            async with self.session.get(url, headers=headers, allow_redirects=True,
+                                        ssl=False) as response:
                 if response.status == 200:
                     content_type = response.headers.get('Content-Type', '').lower()
                     if 'text/html' in content_type or 'text/plain' in content_type:
-                        text = await response.text(errors='ignore')
-                        return text, response.status
-                return None, response.status
+                        # Skip very large documents outright
+                        content_length = response.headers.get('Content-Length', '')
+                        if content_length.isdigit() and int(content_length) > self.MAX_PAGE_BYTES * 4:
+                            return None, response.status, validators
+                        
+                        # Read at most MAX_PAGE_BYTES; emails sit near the top
+                        buf = bytearray()
+                        async for chunk in response.content.iter_chunked(65536):
+                            buf.extend(chunk)
+                            if len(buf) >= self.MAX_PAGE_BYTES:
+                                break
+                        
+                        try:
+                            text = buf.decode(response.charset or 'utf-8', errors='ignore')
+                        except LookupError:  # Unknown charset name
+                            text = buf.decode('utf-8', errors='ignore')
+                        
+                        validators = (
+                            response.headers.get('ETag'),
+                            response.headers.get('Last-Modified'),
+                            xxhash.xxh64_intdigest(buf)
+                        )
+                        return text, response.status, validators
+                return None, response.status, validators
                 
         except asyncio.TimeoutError:
             logger.debug(f"Timeout fetching {url}")
-            return None, 0
+            return None, 0, validators
         except aiohttp.ClientError as e:
             logger.debug(f"Client error fetching {url}: {e}")
-            return None, 0
+            return None, 0, validators
         except Exception as e:
             logger.debug(f"Error fetching {url}: {e}")
-            return None, 0
+            return None, 0, validators
+    
+    def _resolve_link(self, href: str, base_scheme: str, base_netloc: str,
+                      base_path: str, base_dir: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Resolve common href forms without urljoin.
+        
+        Handles http(s) and scheme-relative URLs, absolute paths and
+        relative paths; anything else (other schemes, dot or empty
+        segments, params, whitespace) is left to urljoin.
+        
+        Args:
+            href: Link target
+            base_scheme: Scheme of the page URL
+            base_netloc: Network location of the page URL
+            base_path: Path of the page URL
+            base_dir: base_path up to and including its last '/'
+            
+        Returns:
+            Tuple of (scheme, netloc, path), or None if href needs urljoin
+        """
+        match = self.SIMPLE_LINK_PATTERN.fullmatch(href)
+        if not match:
+            return None
+        
+        scheme, netloc, path = match.groups()
+        if netloc:
+            return scheme or base_scheme, netloc, path
+        
+        if self.REWRITTEN_PATH_PATTERN.search(path):
+            return None
+        if path.startswith('/'):
+            return base_scheme, base_netloc, path
+        return base_scheme, base_netloc, base_dir + path if path else base_path
     
     def extract_links(self, html: str, base_url: str, base_domain: str) -> Set[str]:
         """
@@ -254,37 +525,83 @@ class EmailExtractor:
         links = set()
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = HTMLParser(html)
+            
+            # Split the base once; relative links resolve against its directory
+            base = urlparse(base_url)
+            base_dir = base.path[:base.path.rfind('/') + 1] or '/'
+            fast_resolve = not self.REWRITTEN_PATH_PATTERN.search(base.path)
             
             # Extract from <a> and <area> tags
-            for tag in soup.find_all(['a', 'area'], href=True):
-                href = tag['href']
+            for node in tree.css('a[href], area[href]'):
+                href = node.attributes.get('href')
+                if not href:
+                    continue
                 
                 # Skip mailto, tel, javascript, etc.
                 if href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
                     continue
                 
-                # Convert to absolute URL
-                try:
-                    absolute_url = urljoin(base_url, href)
-                except:
+                # Skip non-HTML resources without resolving them
+                if self.EXCLUDED_LINK_PATTERN.match(href):
                     continue
                 
-                # Remove fragments and query parameters
-                parsed = urlparse(absolute_url)
-                clean_url = urlunparse((
-                    parsed.scheme, parsed.netloc, parsed.path, '', '', ''
-                ))
+                # Convert to absolute URL, dropping query and fragment
+                parts = None
+                if fast_resolve:
+                    parts = self._resolve_link(
+                        href, base.scheme, base.netloc, base.path, base_dir
+                    )
+                if parts is None:
+                    try:
+                        parsed = urlparse(urljoin(base_url, href))
+                    except:
+                        continue
+                    parts = (parsed.scheme, parsed.netloc, parsed.path)
                 
                 # Validate and add
-                if self.is_valid_url(clean_url, base_domain):
-                    links.add(clean_url)
+                if self._is_valid_parts(*parts, base_domain):
+                    scheme, netloc, path = parts
+                    links.add(f"{scheme}://{netloc}{path}")
                     
         except Exception as e:
             logger.error(f"Error parsing links from {base_url}: {e}")
         
         return links
     
+    def find_emails(self, text: str) -> List[str]:
+        """
+        Find email addresses in plain text.
+        
+        Uses Hyperscan when available, otherwise EMAIL_PATTERN.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            List of matched email addresses
+        """
+        if self.email_db is None:
+            return self.EMAIL_PATTERN.findall(text)
+        
+        buf = text.encode('utf-8', 'ignore')
+        spans = []
+        
+        def on_match(id, from_, to, flags, context):
+            spans.append((from_, to))
+        
+        self.email_db.scan(buf, match_event_handler=on_match)
+        
+        # Hyperscan reports every match end; keep the leftmost-longest,
+        # non-overlapping spans to mirror re.findall
+        found = []
+        last_end = -1
+        for start, end in sorted(spans, key=lambda span: (span[0], -span[1])):
+            if start >= last_end:
+                found.append(buf[start:end].decode('utf-8', 'ignore'))
+                last_end = end
+        return found
+    
     def extract_emails_from_html(self, html: str) -> Set[str]:
         """
         Extract all emails from HTML content.
@@ -297,26 +614,31 @@ class EmailExtractor:
         """
         emails = set()
         
+        # Pages without '@', an entity for it or an obfuscated separator
+        # cannot contain emails
+        if '@' not in html and not self.OBFUSCATED_HINT_PATTERN.search(html):
+            return emails
+        
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = HTMLParser(html)
             
             # Extract from mailto links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('mailto:'):
-                    email = href[7:].split('?')[0].strip()
-                    if email:
-                        emails.add(email)
+            for node in tree.css('a[href^="mailto:"]'):
+                href = node.attributes.get('href') or ''
+                email = href[7:].split('?')[0].strip()
+                if email:
+                    emails.add(email)
             
-            # Get text content
-            text = soup.get_text()
+            # Get text content (fall back to the whole document for
+            # fragments without a <body>)
+            root = tree.body or tree.root
+            text = root.text(separator=' ') if root else ''
             
             # Handle obfuscated emails
-            for pattern, replacement in self.OBFUSCATED_PATTERNS:
-                text = pattern.sub(replacement, text)
+            text = self.OBFUSCATED_PATTERN.sub(self._deobfuscate, text)
             
             # Find standard email patterns
-            found = self.EMAIL_PATTERN.findall(text)
+            found = self.find_emails(text)
             emails.update(found)
             
         except Exception as e:
@@ -324,6 +646,44 @@ class EmailExtractor:
         
         return emails
     
+    async def parse_page(self, html: str, url: str, base_domain: str,
+                         find_emails: bool, find_links: bool
+                         ) -> Tuple[Set[str], Set[str]]:
+        """
+        Run _parse_page in the parse pool.
+        
+        A parse process that dies (out of memory, a crash in a native
+        parser) breaks the whole pool, so it is replaced and the page
+        retried once. If the retry breaks the new pool too, the page is
+        most likely the cause and is skipped rather than parsed here.
+        
+        Returns:
+            Tuple of (raw_emails, links)
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self.parse_pool
+            try:
+                return await loop.run_in_executor(
+                    pool, _parse_page, html, url, base_domain, find_emails, find_links
+                )
+            except BrokenProcessPool:
+                # Concurrent parses all see the same broken pool; only
+                # the first replaces it
+                if pool is self.parse_pool:
+                    logger.error("Parse pool broke, replacing it")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        
+        logger.error(f"Skipping {url}: parse process died twice")
+        return set(), set()
+    
+    @staticmethod
+    def _deobfuscate(match) -> str:
+        """Rewrite an OBFUSCATED_PATTERN match as a plain address."""
+        domain = match.group(2) or match.group(3) or match.group(4)
+        return f"{match.group(1)}@{domain}.{match.group(5)}"
+    
     def normalize_email(self, email: str) -> Optional[str]:
         """
         Normalize and validate email address.
@@ -342,6 +702,14 @@ class EmailExtractor:
             # Remove common trailing characters
             email = email.strip('<>()[]{}"\' ')
             
+            # Fast path for the common case; '--' can mean an IDNA label
+            # that only email-validator can check
+            if (len(email) <= 254
+                    and '--' not in email
+                    and self.SIMPLE_EMAIL_PATTERN.fullmatch(email)
+                    and email.rsplit('.', 1)[1] not in self.SPECIAL_USE_TLDS):
+                return email
+            
             # Validate using email-validator library
             validated = validate_email(email, check_deliverability=False)
             return validated.normalized
@@ -362,105 +730,220 @@ class EmailExtractor:
             worker_id: Worker identifier
         """
         base_domain = self.extract_domain(url)
+        # Exact set for typical sites; past VISITED_EXACT_LIMIT a Bloom
+        # filter keeps memory flat, and a false positive only skips a page
         visited_urls = set()
-        emails_found = {}  # {normalized_email: (raw_email, page_url, page_id)}
+        visited_filter = None
+        visited_count = 0
+        emails_found = {}  # {normalized_email: (raw_email, page_url)}
+        prior_pages = {}  # {url: (page_id, etag, last_modified, body_hash)}
+        prior_emails = {}  # {page_id: [(raw_email, normalized_email)]}
+        # 304 pages whose emails were taken from the last crawl
+        reused_urls = []
+        
+        # Frontier of (depth, url) tuples consumed by the crawl workers
+        frontier = asyncio.Queue()
         
-        # Queue: list of (depth, url) tuples
-        queue = [(0, url)]
+        def mark_visited(link: str) -> bool:
+            """Record a URL; False if it was already queued."""
+            nonlocal visited_filter, visited_count
+            if visited_filter is not None:
+                if visited_filter.add(link):
+                    return False
+            elif link in visited_urls:
+                return False
+            else:
+                visited_urls.add(link)
+                if len(visited_urls) > self.VISITED_EXACT_LIMIT:
+                    visited_filter = ScalableBloomFilter(
+                        initial_capacity=len(visited_urls) * 2,
+                        error_rate=1e-6,
+                        mode=ScalableBloomFilter.SMALL_SET_GROWTH
+                    )
+                    for seen in visited_urls:
+                        visited_filter.add(seen)
+                    visited_urls.clear()
+            visited_count += 1
+            return True
         
         async def process_url(depth: int, current_url: str):
             """Process a single URL."""
-            if depth > self.max_depth or current_url in visited_urls:
+            if depth > self.max_depth:
                 return
             
-            visited_urls.add(current_url)
+            # Leaf pages need no links, so a 304 from a conditional GET
+            # is enough to reuse the last crawl's emails
+            prior = prior_pages.get(current_url[:1000])
+            headers = None
+            if prior and depth >= self.max_depth and (prior[1] or prior[2]):
+                headers = {}
+                if prior[1]:
+                    headers['If-None-Match'] = prior[1]
+                if prior[2]:
+                    headers['If-Modified-Since'] = prior[2]
             
             # Fetch page
-            html, status_code = await self.fetch_page(current_url)
+            html, status_code, (etag, last_modified, body_hash) = \
+                await self.fetch_page(current_url, headers)
             
-            # Store page record
-            page_id = None
-            try:
-                async with self.db_pool.acquire() as conn:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(
-                            """INSERT INTO pages (domain_id, url, status_code, 
-                               content_type, error_message)
-                               VALUES (%s, %s, %s, %s, %s)""",
-                            (domain_id, current_url[:1000], status_code,
-                             'text/html' if html else None,
-                             None if html else 'Failed to fetch')
-                        )
-                        page_id = cursor.lastrowid
-            except Exception as e:
-                logger.error(f"Failed to store page record for {current_url}: {e}")
+            not_modified = status_code == 304 and prior is not None
+            if not_modified:
+                etag, last_modified, body_hash = prior[1:]
+            
+            # Queue page record for the batch writer
+            self.page_queue.put_nowait((
+                domain_id, current_url[:1000], status_code,
+                'text/html' if html or not_modified else None,
+                None if html or not_modified else 'Failed to fetch',
+                etag[:128] if etag else None,
+                last_modified[:64] if last_modified else None,
+                body_hash
+            ))
             
-            if not html or not page_id:
+            # A 304 has no body: reuse the last crawl's emails. Any page
+            # whose body is in hand is scanned, which costs little next to
+            # the fetch and keeps the reuse limited to 304 leaf pages.
+            if not_modified:
+                reused_urls.append(current_url)
+                for raw_email, normalized in prior_emails.get(prior[0], ()):
+                    if normalized not in emails_found:
+                        emails_found[normalized] = (raw_email, current_url)
                 return
             
-            # Extract emails
-            raw_emails = self.extract_emails_from_html(html)
+            if not html:
+                return
+            
+            find_links = depth < self.max_depth
+            
+            # Parse in the process pool
+            raw_emails, links = await self.parse_page(
+                html, current_url, base_domain, True, find_links
+            )
+            
             for raw_email in raw_emails:
                 normalized = self.normalize_email(raw_email)
                 if normalized and normalized not in emails_found:
-                    emails_found[normalized] = (raw_email, current_url, page_id)
+                    emails_found[normalized] = (raw_email, current_url)
             
-            # Extract links for further crawling
-            if depth < self.max_depth:
-                links = self.extract_links(html, current_url, base_domain)
-                
+            # Queue links for further crawling
+            if find_links:
                 # Prioritize email-containing paths
-                priority_links = [
-                    link for link in links 
-                    if any(path in link.lower() for path in self.EMAIL_PATHS)
-                ]
-                other_links = [link for link in links if link not in priority_links]
+                priority_links = []
+                other_links = []
+                for link in links:
+                    if self.EMAIL_PATHS_PATTERN.search(link):
+                        priority_links.append(link)
+                    else:
+                        other_links.append(link)
                 
-                # Add to queue
+                # Add to frontier, each URL once
                 for link in priority_links + other_links:
-                    if link not in visited_urls:
-                        queue.append((depth + 1, link))
+                    if mark_visited(link):
+                        frontier.put_nowait((depth + 1, link))
+        
+        async def worker():
+            """Consume URLs from the frontier until cancelled."""
+            while True:
+                depth, current_url = await frontier.get()
+                try:
+                    await process_url(depth, current_url)
+                except Exception as e:
+                    logger.debug(f"Error processing {current_url}: {e}")
+                finally:
+                    frontier.task_done()
         
         try:
-            # Update domain status to crawling
+            # Claim the domain; another worker may already have it
             async with self.db_pool.acquire() as conn:
                 async with conn.cursor() as cursor:
                     await cursor.execute(
                         """UPDATE domains SET status='crawling', worker_id=%s, 
-                           locked_at=NOW() WHERE id=%s""",
+                           locked_at=NOW() WHERE id=%s AND status='pending'""",
                         (worker_id, domain_id)
                     )
+                    if cursor.rowcount == 0:
+                        logger.info(f"Domain {domain_id} already claimed, skipping")
+                        return
+            
+            # Load validators and emails from the last completed crawl of
+            # this domain
+            try:
+                async with self.db_pool.acquire() as conn:
+                    async with conn.cursor() as cursor:
+                        await cursor.execute(
+                            """SELECT id FROM domains
+                               WHERE domain = (SELECT domain FROM domains WHERE id=%s)
+                               AND status='completed' AND id != %s
+                               ORDER BY id DESC LIMIT 1""",
+                            (domain_id, domain_id)
+                        )
+                        result = await cursor.fetchone()
+                        if result:
+                            await cursor.execute(
+                                """SELECT id, url, etag, last_modified, body_hash
+                                   FROM pages
+                                   WHERE domain_id=%s AND status_code IN (200, 304)""",
+                                (result[0],)
+                            )
+                            for page_id, page_url, etag, last_modified, body_hash in await cursor.fetchall():
+                                prior_pages[page_url] = (page_id, etag, last_modified, body_hash)
+                            
+                            await cursor.execute(
+                                """SELECT page_id, raw_email, normalized_email
+                                   FROM emails WHERE domain_id=%s""",
+                                (result[0],)
+                            )
+                            for page_id, raw_email, normalized in await cursor.fetchall():
+                                prior_emails.setdefault(page_id, []).append((raw_email, normalized))
+            except Exception as e:
+                logger.warning(f"Failed to load previous crawl of {base_domain}: {e}")
             
             logger.info(f"Starting crawl of domain {base_domain} (ID: {domain_id})")
             
-            # Process URLs with concurrency
-            tasks = []
-            while queue:
-                # Process in batches
-                batch_size = min(50, len(queue))
-                batch = [queue.pop(0) for _ in range(batch_size)]
-                
-                for depth, current_url in batch:
-                    task = asyncio.create_task(process_url(depth, current_url))
-                    tasks.append(task)
-                
-                # Wait for batch to complete
-                if len(tasks) >= 50:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                    tasks = []
+            # Process URLs with a fixed pool of long-lived workers
+            mark_visited(url)
+            frontier.put_nowait((0, url))
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(min(self.PAGE_CONCURRENCY, self.max_concurrent))
+            ]
+            try:
+                await frontier.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
             
-            # Wait for remaining tasks
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            # Each email was stored against the first page it was found on,
+            # so a reused page only brings the emails attributed to it. If
+            # any email of the last crawl is now missing, it may still be on
+            # a reused page: parse those pages after all.
+            if reused_urls and any(
+                normalized not in emails_found
+                for page_emails in prior_emails.values()
+                for _, normalized in page_emails
+            ):
+                await self._reparse_pages(reused_urls, base_domain, emails_found)
             
-            # Store extracted emails
+            # Store extracted emails once their page records are written
             if emails_found:
+                await self.flush_pages()
                 try:
                     async with self.db_pool.acquire() as conn:
                         async with conn.cursor() as cursor:
+                            await cursor.execute(
+                                """SELECT id, url FROM pages WHERE domain_id=%s""",
+                                (domain_id,)
+                            )
+                            page_ids = {
+                                page_url: page_id
+                                for page_id, page_url in await cursor.fetchall()
+                            }
                             values = [
-                                (domain_id, page_id, raw[:255], normalized[:255])
-                                for normalized, (raw, _, page_id) in emails_found.items()
+                                (domain_id, page_ids[page_url[:1000]],
+                                 raw[:255], normalized[:255])
+                                for normalized, (raw, page_url) in emails_found.items()
+                                if page_url[:1000] in page_ids
                             ]
                             await cursor.executemany(
                                 """INSERT IGNORE INTO emails 
@@ -471,19 +954,24 @@ class EmailExtractor:
                 except Exception as e:
                     logger.error(f"Failed to store emails for domain {domain_id}: {e}")
             
-            # Update domain status
+            # Update domain status and the search totals together
             async with self.db_pool.acquire() as conn:
                 async with conn.cursor() as cursor:
                     await cursor.execute(
-                        """UPDATE domains SET status='completed', 
-                           pages_crawled=%s, emails_found=%s, 
-                           worker_id=NULL, locked_at=NULL
-                           WHERE id=%s""",
-                        (len(visited_urls), len(emails_found), domain_id)
+                        """UPDATE domains d JOIN searches s ON s.id = d.search_id
+                           SET d.status='completed', 
+                           d.pages_crawled=%s, d.emails_found=%s, 
+                           d.worker_id=NULL, d.locked_at=NULL,
+                           s.domains_completed = s.domains_completed + 1,
+                           s.total_pages_crawled = s.total_pages_crawled + %s,
+                           s.total_emails_found = s.total_emails_found + %s
+                           WHERE d.id=%s""",
+                        (visited_count, len(emails_found),
+                         visited_count, len(emails_found), domain_id)
                     )
             
             logger.info(
-                f"Completed {base_domain}: {len(visited_urls)} pages, "
+                f"Completed {base_domain}: {visited_count} pages, "
                 f"{len(emails_found)} unique emails"
             )
             
@@ -493,14 +981,78 @@ class EmailExtractor:
                 async with self.db_pool.acquire() as conn:
                     async with conn.cursor() as cursor:
                         await cursor.execute(
-                            """UPDATE domains SET status='failed', 
-                               error_message=%s, worker_id=NULL, locked_at=NULL
-                               WHERE id=%s""",
+                            """UPDATE domains d JOIN searches s ON s.id = d.search_id
+                               SET d.status='failed', 
+                               d.error_message=%s, d.worker_id=NULL, d.locked_at=NULL,
+                               s.domains_failed = s.domains_failed + 1
+                               WHERE d.id=%s AND d.status != 'failed'""",
                             (str(e)[:500], domain_id)
                         )
             except Exception as db_error:
                 logger.error(f"Failed to update domain status: {db_error}")
     
+    async def _reparse_pages(self, urls: List[str], base_domain: str,
+                             emails_found: dict):
+        """
+        Fetch pages unconditionally and add the emails they contain.
+        
+        Args:
+            urls: Page URLs
+            base_domain: Base domain of the crawl
+            emails_found: {normalized_email: (raw_email, page_url)}, updated
+        """
+        async def reparse(url: str):
+            html, _, _ = await self.fetch_page(url)
+            if not html:
+                return
+            raw_emails, _ = await self.parse_page(html, url, base_domain, True, False)
+            for raw_email in raw_emails:
+                normalized = self.normalize_email(raw_email)
+                if normalized and normalized not in emails_found:
+                    emails_found[normalized] = (raw_email, url)
+        
+        logger.info(f"Re-parsing {len(urls)} unchanged pages of {base_domain}")
+        for i in range(0, len(urls), self.PAGE_CONCURRENCY):
+            await asyncio.gather(
+                *(reparse(url) for url in urls[i:i + self.PAGE_CONCURRENCY]),
+                return_exceptions=True
+            )
+    
+    async def claim_pending_search(self) -> Optional[int]:
+        """
+        Claim the oldest pending search by moving it to 'in_progress'.
+        
+        SKIP LOCKED lets concurrent workers, in this or other processes,
+        pass over rows another worker is claiming.
+        
+        Returns:
+            Search ID, or None if no search is pending
+        """
+        async with self.db_pool.acquire() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        """SELECT id FROM searches
+                           WHERE status='pending'
+                           ORDER BY created_at ASC
+                           LIMIT 1
+                           FOR UPDATE SKIP LOCKED"""
+                    )
+                    result = await cursor.fetchone()
+                    if result:
+                        await cursor.execute(
+                            """UPDATE searches SET status='in_progress',
+                               started_at=COALESCE(started_at, NOW()) WHERE id=%s""",
+                            (result[0],)
+                        )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        
+        return result[0] if result else None
+    
     async def process_search(self, search_id: int, worker_id: str):
         """
         Process all domains in a search.
@@ -510,12 +1062,12 @@ class EmailExtractor:
             worker_id: Worker identifier
         """
         try:
-            # Update search status
+            # Update search status (no-op if a worker already claimed it)
             async with self.db_pool.acquire() as conn:
                 async with conn.cursor() as cursor:
                     await cursor.execute(
                         """UPDATE searches SET status='in_progress', 
-                           started_at=NOW() WHERE id=%s""",
+                           started_at=NOW() WHERE id=%s AND status='pending'""",
                         (search_id,)
                     )
             
@@ -535,6 +1087,8 @@ class EmailExtractor:
             
             if not domains:
                 logger.warning(f"No pending domains found for search {search_id}")
+                # e.g. paused during its last batch and then resumed
+                await self._finish_search(search_id, 'completed')
                 return
             
             logger.info(f"Processing {len(domains)} domains for search {search_id}")
@@ -548,32 +1102,85 @@ class EmailExtractor:
             # Process in batches for memory efficiency
             batch_size = self.max_concurrent
             for i in range(0, len(tasks), batch_size):
+                # Stop between batches once the search is paused or cancelled;
+                # a resume sets it back to 'pending' for a worker to claim
+                if i and await self._search_status(search_id) != 'in_progress':
+                    for task in tasks[i:]:
+                        task.close()
+                    logger.info(f"Search {search_id} no longer in progress, stopping")
+                    return
                 batch = tasks[i:i + batch_size]
                 logger.info(f"Processing batch {i//batch_size + 1}/{(len(tasks)-1)//batch_size + 1}")
                 await asyncio.gather(*batch, return_exceptions=True)
             
             # Update search status
-            async with self.db_pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    await cursor.execute(
-                        """UPDATE searches SET status='completed', 
-                           completed_at=NOW() WHERE id=%s""",
-                        (search_id,)
-                    )
-            
-            logger.info(f"Search {search_id} completed successfully")
+            if await self._finish_search(search_id, 'completed'):
+                logger.info(f"Search {search_id} completed successfully")
             
         except Exception as e:
             logger.error(f"Error processing search {search_id}: {e}")
             try:
-                async with self.db_pool.acquire() as conn:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(
-                            """UPDATE searches SET status='failed' WHERE id=%s""",
-                            (search_id,)
-                        )
+                await self._finish_search(search_id, 'failed')
             except Exception as db_error:
                 logger.error(f"Failed to update search status: {db_error}")
+    
+    async def _search_status(self, search_id: int) -> Optional[str]:
+        """Current status of a search, or None if it does not exist."""
+        async with self.db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """SELECT status FROM searches WHERE id=%s""",
+                    (search_id,)
+                )
+                result = await cursor.fetchone()
+                return result[0] if result else None
+    
+    async def _finish_search(self, search_id: int, status: str) -> bool:
+        """
+        Move an in-progress search to a final status.
+        
+        A search paused or cancelled meanwhile keeps its status.
+        
+        Returns:
+            True if the search was updated
+        """
+        async with self.db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """UPDATE searches SET status=%s, completed_at=NOW()
+                       WHERE id=%s AND status='in_progress'""",
+                    (status, search_id)
+                )
+                return cursor.rowcount > 0
+
+
+# Per-process extractor used by _parse_page in the parse pool
+_page_parser = None
+
+
+def _parse_page(html: str, base_url: str, base_domain: str,
+                find_emails: bool = True, find_links: bool = True
+                ) -> Tuple[Set[str], Set[str]]:
+    """
+    Extract emails and links from a page; runs in a parse pool process.
+    
+    Args:
+        html: HTML content
+        base_url: Page URL for relative links
+        base_domain: Base domain to filter links
+        find_emails: Whether to extract emails
+        find_links: Whether to extract links
+        
+    Returns:
+        Tuple of (raw_emails, links)
+    """
+    global _page_parser
+    if _page_parser is None:
+        _page_parser = EmailExtractor({})
+    
+    emails = _page_parser.extract_emails_from_html(html) if find_emails else set()
+    links = _page_parser.extract_links(html, base_url, base_domain) if find_links else set()
+    return emails, links
 
 
 async def main():
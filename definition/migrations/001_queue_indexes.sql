@@ -0,0 +1,16 @@
+-- Composite indexes for the worker queue queries
+-- Apply to databases created from an older schema.sql
+
+USE email_extraction;
+
+-- Pending search lookup: WHERE status=... ORDER BY created_at
+ALTER TABLE searches
+    DROP INDEX idx_status,
+    ADD INDEX idx_status_created (status, created_at);
+
+-- Pending domain lookup: WHERE search_id=... AND status=...
+ALTER TABLE domains
+    DROP INDEX idx_search,
+    ADD INDEX idx_search_status (search_id, status);
+
+-- emails already has UNIQUE KEY unique_email_domain (domain_id, normalized_email)
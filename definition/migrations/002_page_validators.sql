@@ -0,0 +1,13 @@
+-- Conditional GET validators and body hash for re-crawls
+-- Apply to databases created from an older schema.sql
+
+USE email_extraction;
+
+ALTER TABLE pages
+    ADD COLUMN etag VARCHAR(128) NULL AFTER error_message,
+    ADD COLUMN last_modified VARCHAR(64) NULL AFTER etag,
+    ADD COLUMN body_hash BIGINT UNSIGNED NULL AFTER last_modified;
+
+-- Previous crawls are looked up by domain name across searches
+ALTER TABLE domains
+    ADD INDEX idx_domain (domain);
@@ -0,0 +1,7 @@
+-- 'queued' search status: created, domains not yet inserted
+-- Apply to databases created from an older schema.sql
+
+USE email_extraction;
+
+ALTER TABLE searches
+    MODIFY COLUMN status ENUM('queued', 'pending', 'in_progress', 'completed', 'paused', 'cancelled') DEFAULT 'pending';
@@ -0,0 +1,26 @@
+-- Per-search totals maintained by the extractor as domains finish
+-- Apply to databases created from an older schema.sql
+
+USE email_extraction;
+
+ALTER TABLE searches
+    ADD COLUMN domains_completed INT DEFAULT 0 AFTER total_domains,
+    ADD COLUMN domains_failed INT DEFAULT 0 AFTER domains_completed,
+    ADD COLUMN total_pages_crawled INT DEFAULT 0 AFTER domains_failed,
+    ADD COLUMN total_emails_found INT DEFAULT 0 AFTER total_pages_crawled;
+
+-- Backfill existing searches
+UPDATE searches s
+JOIN (
+    SELECT search_id,
+           SUM(status='completed') AS domains_completed,
+           SUM(status='failed') AS domains_failed,
+           SUM(pages_crawled) AS total_pages_crawled,
+           SUM(emails_found) AS total_emails_found
+    FROM domains
+    GROUP BY search_id
+) d ON d.search_id = s.id
+SET s.domains_completed = d.domains_completed,
+    s.domains_failed = d.domains_failed,
+    s.total_pages_crawled = d.total_pages_crawled,
+    s.total_emails_found = d.total_emails_found;
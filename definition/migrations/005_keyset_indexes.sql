@@ -0,0 +1,18 @@
+-- Indexes matching the API's keyset pagination order
+-- Apply to databases created from an older schema.sql
+
+USE email_extraction;
+
+-- list_searches: [WHERE status=...] ORDER BY created_at DESC, id DESC
+ALTER TABLE searches
+    DROP INDEX idx_status_created,
+    ADD INDEX idx_status_created (status, created_at DESC, id DESC),
+    DROP INDEX idx_created,
+    ADD INDEX idx_created (created_at DESC, id DESC);
+
+-- get_search_domains: WHERE search_id=... [AND status=...]
+--                     ORDER BY updated_at DESC, id DESC
+ALTER TABLE domains
+    DROP INDEX idx_search_status,
+    ADD INDEX idx_search_status (search_id, status, updated_at DESC, id DESC),
+    ADD INDEX idx_search_updated (search_id, updated_at DESC, id DESC);
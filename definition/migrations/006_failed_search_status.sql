@@ -0,0 +1,8 @@
+-- 'failed' search status: set by the extractor on errors and by the API
+-- when a queued search's domains cannot be inserted
+-- Apply to databases created from an older schema.sql
+
+USE email_extraction;
+
+ALTER TABLE searches
+    MODIFY COLUMN status ENUM('queued', 'pending', 'in_progress', 'completed', 'paused', 'cancelled', 'failed') DEFAULT 'pending';
@@ -9,12 +9,16 @@ CREATE TABLE searches (
     id BIGINT AUTO_INCREMENT PRIMARY KEY,
     batch_name VARCHAR(255),
     total_domains INT DEFAULT 0,
-    status ENUM('pending', 'in_progress', 'completed', 'paused', 'cancelled') DEFAULT 'pending',
+    domains_completed INT DEFAULT 0,
+    domains_failed INT DEFAULT 0,
+    total_pages_crawled INT DEFAULT 0,
+    total_emails_found INT DEFAULT 0,
+    status ENUM('queued', 'pending', 'in_progress', 'completed', 'paused', 'cancelled', 'failed') DEFAULT 'pending',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     started_at TIMESTAMP NULL,
     completed_at TIMESTAMP NULL,
-    INDEX idx_status (status),
-    INDEX idx_created (created_at)
+    INDEX idx_status_created (status, created_at DESC, id DESC),
+    INDEX idx_created (created_at DESC, id DESC)
 ) ENGINE=InnoDB;
 
 -- Domains table: track individual domains within searches
@@ -33,7 +37,9 @@ CREATE TABLE domains (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (search_id) REFERENCES searches(id) ON DELETE CASCADE,
     UNIQUE KEY unique_domain_search (search_id, domain),
-    INDEX idx_search (search_id),
+    INDEX idx_search_status (search_id, status, updated_at DESC, id DESC),
+    INDEX idx_search_updated (search_id, updated_at DESC, id DESC),
+    INDEX idx_domain (domain),
     INDEX idx_status (status),
     INDEX idx_worker (worker_id),
     INDEX idx_locked (locked_at)
@@ -48,6 +54,9 @@ CREATE TABLE pages (
     content_type VARCHAR(100) NULL,
     crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     error_message TEXT NULL,
+    etag VARCHAR(128) NULL,
+    last_modified VARCHAR(64) NULL,
+    body_hash BIGINT UNSIGNED NULL,
     FOREIGN KEY (domain_id) REFERENCES domains(id) ON DELETE CASCADE,
     UNIQUE KEY unique_url_domain (domain_id, url(500)),
     INDEX idx_domain (domain_id),
@@ -7,7 +7,6 @@ import os
 import logging
 import time
 from core import EmailExtractor
-import aiomysql
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,28 +30,16 @@ MAX_CONCURRENT = int(os.getenv('MAX_CONCURRENT', 1000))
 WORKER_ID = os.getenv('WORKER_ID', f'worker-{os.getpid()}')
 POLL_INTERVAL = int(os.getenv('POLL_INTERVAL', 5))  # seconds between polls
 
-# Global database pool
-db_pool = None
+# Global extractor; its database pool and HTTP session are shared
+# with the polling queries
 extractor = None
 
 
 async def initialize():
-    """Initialize database pool and extractor."""
-    global db_pool, extractor
+    """Initialize the extractor."""
+    global extractor
     
     try:
-        # Create database pool
-        db_pool = await aiomysql.create_pool(
-            host=DB_CONFIG['host'],
-            port=DB_CONFIG['port'],
-            user=DB_CONFIG['user'],
-            password=DB_CONFIG['password'],
-            db=DB_CONFIG['database'],
-            autocommit=True,
-            maxsize=50,
-            charset='utf8mb4'
-        )
-        
         # Create extractor
         extractor = EmailExtractor(
             DB_CONFIG,
@@ -70,21 +57,15 @@ async def initialize():
 
 
 async def get_pending_search():
-    """Get a pending search from the database."""
+    """Claim a pending search, or find an in-progress one with pending domains."""
     try:
-        async with db_pool.acquire() as conn:
+        # Prefer a pending search over resuming an in_progress one
+        search_id = await extractor.claim_pending_search()
+        if search_id:
+            return search_id
+        
+        async with extractor.db_pool.acquire() as conn:
             async with conn.cursor() as cursor:
-                # Get a pending search (prefer pending over in_progress)
-                await cursor.execute(
-                    """SELECT id FROM searches 
-                       WHERE status='pending'
-                       ORDER BY created_at ASC
-                       LIMIT 1""",
-                )
-                result = await cursor.fetchone()
-                if result:
-                    return result[0]
-                
                 # If no pending, check for in_progress searches with domains still pending
                 await cursor.execute(
                     """SELECT DISTINCT s.id FROM searches s
@@ -144,14 +125,11 @@ async def worker_loop():
 
 async def cleanup():
     """Cleanup resources."""
-    global db_pool, extractor
+    global extractor
     
     try:
         if extractor:
             await extractor.cleanup()
-        if db_pool:
-            db_pool.close()
-            await db_pool.wait_closed()
         logger.info(f"Worker {WORKER_ID} cleanup completed")
     except Exception as e:
         logger.error(f"Error during cleanup: {e}")
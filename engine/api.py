@@ -1,15 +1,21 @@
 # email_extractor/api.py
 # FastAPI REST API for Email Extraction System
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, validator
 from typing import List, Optional
 import asyncio
 import aiomysql
-from datetime import datetime
-import uuid
+from datetime import datetime, timedelta
 import os
+import re
+import time
+import base64
+import hashlib
+import orjson
+from cachetools import TLRUCache
 from core import EmailExtractor
 import logging
 
@@ -25,17 +31,105 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'email_extraction')
 }
 
-# Global database pool
+# Connection pool sizing. The connection budget for the API
+# (DB_MAX_CONNECTIONS, a share of MySQL's max_connections) is split
+# across the WEB_CONCURRENCY worker processes. Each process has two
+# pools, its request pool and the pool of its shared EmailExtractor,
+# which divide the per-process share between them:
+#   DB_PROCESS_BUDGET  = DB_MAX_CONNECTIONS // WEB_CONCURRENCY
+#   DB_MAX_POOL        = a quarter of it, between 5 and 50
+#   EXTRACTOR_DB_POOL  = the rest, at least 5
+# DB_MIN_POOL connections are opened at startup so the first requests do
+# not pay for the TCP handshake and MySQL authentication.
+DB_MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', 200))
+WEB_CONCURRENCY = max(1, int(os.getenv('WEB_CONCURRENCY', 1)))
+DB_PROCESS_BUDGET = DB_MAX_CONNECTIONS // WEB_CONCURRENCY
+DB_MAX_POOL = int(os.getenv(
+    'DB_MAX_POOL', max(5, min(50, DB_PROCESS_BUDGET // 4))
+))
+EXTRACTOR_DB_POOL = int(os.getenv(
+    'EXTRACTOR_DB_POOL', max(5, DB_PROCESS_BUDGET - DB_MAX_POOL)
+))
+# Each web worker also runs PARSE_WORKERS HTML parse processes; by
+# default the CPUs are shared out across the web workers
+PARSE_WORKERS = int(os.getenv(
+    'PARSE_WORKERS', max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY)
+))
+DB_MIN_POOL = min(int(os.getenv('DB_MIN_POOL', 10)), DB_MAX_POOL)
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 3600))  # below wait_timeout
+
+# Global database pool. Statements are sent as text: aiomysql has no
+# binary-protocol prepared statements, and SQL-level PREPARE/EXECUTE
+# needs a SET @param round trip per call, which costs more than parsing
+# the primary-key and index-range lookups used here.
 db_pool = None
 
-# Background worker instances
-active_extractors = {}
+# Domain rows per multi-row INSERT
+DOMAIN_INSERT_CHUNK = 1000
+
+# Searches with at least this many domains are created as 'queued' and
+# their domains inserted by the background insert worker, which groups
+# searches arriving within INSERT_BATCH_WINDOW seconds into one batch
+ASYNC_INSERT_MIN_DOMAINS = int(os.getenv('ASYNC_INSERT_MIN_DOMAINS', 100))
+INSERT_BATCH_WINDOW = 0.05
+
+# The queue is in memory, so a 'queued' search whose process restarted
+# never gets its domains. Searches still 'queued' after QUEUED_STALE_AFTER
+# seconds are failed; every process sweeps for them at startup and then
+# every QUEUED_SWEEP_INTERVAL seconds.
+QUEUED_STALE_AFTER = int(os.getenv('QUEUED_STALE_AFTER', 300))
+QUEUED_SWEEP_INTERVAL = 60
+
+# Email listings are streamed from a server-side cursor; limit may not
+# exceed EMAIL_RESULT_MAX rows per request
+EMAIL_RESULT_MAX = int(os.getenv('EMAIL_RESULT_MAX', 10000))
+STREAM_FETCH_SIZE = 500
+
+# (search_id, domains) pairs waiting for insert_worker
+insert_queue = None
+insert_worker_task = None
+
+# Persistent extraction workers; each claims pending searches from the
+# database and runs them on the process-wide app.state.extractor, so the
+# worker count also bounds the searches running at once
+EXTRACTION_WORKERS = int(os.getenv('WORKERS', 4))
+WORKER_POLL_INTERVAL = 0.5
+extraction_workers = []
+
+# Searches in flight in this process: {worker_id: search_id}
+active_searches = {}
+
+# Read cache for status-polling endpoints: {key: (ttl, value)}.
+# The cache is per process and invalidate_search_cache() only clears the
+# local one, so other web workers rely on the TTL alone. Every row that
+# can still change gets the short TTL; only searches that are finished for
+# good are kept longer. A cancelled search is not one of them: its
+# in-flight domains keep updating its statistics.
+CACHE_TTL_ACTIVE = float(os.getenv('CACHE_TTL_ACTIVE', 2))
+CACHE_TTL_TERMINAL = float(os.getenv('CACHE_TTL_TERMINAL', 300))
+TERMINAL_STATUSES = {'completed', 'failed'}
+
+read_cache = TLRUCache(
+    maxsize=4096,
+    ttu=lambda key, value, now: now + value[0],
+    timer=time.monotonic
+)
+# In-flight cache misses: {key: Future}
+pending_fetches = {}
 
 app = FastAPI(
     title="Email Extraction API",
     description="High-performance email extraction system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
+# Compresses the larger listings, including streamed ones; disable any
+# compression on a reverse proxy in front of the API
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# Syntactic check for a bare host name, applied after strip() and lower()
+DOMAIN_PATTERN = re.compile(r'^[a-z0-9.-]{1,253}$')
 
 
 # Pydantic models
@@ -44,9 +138,11 @@ class DomainInput(BaseModel):
     
     @validator('domain')
     def validate_domain(cls, v):
-        v = v.strip()
+        v = v.strip().lower()
         if not v:
             raise ValueError('Domain cannot be empty')
+        if not DOMAIN_PATTERN.match(v):
+            raise ValueError(f'Invalid domain: {v}')
         return v
 
 
@@ -60,7 +156,21 @@ class SearchCreate(BaseModel):
             raise ValueError('At least one domain is required')
         if len(v) > 10000:
             raise ValueError('Maximum 10000 domains per batch')
-        return [d.strip() for d in v if d.strip()]
+        
+        # Normalize, validate and de-duplicate in one pass; duplicates
+        # would otherwise fail the (search_id, domain) unique key on insert
+        match = DOMAIN_PATTERN.match
+        seen = set()
+        domains = []
+        for d in v:
+            d = d.strip().lower()
+            if d and d not in seen and match(d):
+                seen.add(d)
+                domains.append(d)
+        
+        if not domains:
+            raise ValueError('At least one valid domain is required')
+        return domains
 
 
 class SearchResponse(BaseModel):
@@ -105,7 +215,7 @@ class SearchStatistics(BaseModel):
 # Startup and shutdown
 @app.on_event("startup")
 async def startup():
-    global db_pool
+    global db_pool, insert_queue, insert_worker_task, extraction_workers
     db_pool = await aiomysql.create_pool(
         host=DB_CONFIG['host'],
         port=DB_CONFIG['port'],
@@ -113,61 +223,369 @@ async def startup():
         password=DB_CONFIG['password'],
         db=DB_CONFIG['database'],
         autocommit=True,
-        maxsize=50,
-        charset='utf8mb4'
+        minsize=DB_MIN_POOL,
+        maxsize=DB_MAX_POOL,
+        pool_recycle=DB_POOL_RECYCLE,
+        charset='utf8mb4',
+        # UTC sessions, so NOW() matches created_at from datetime.utcnow()
+        init_command="SET time_zone='+00:00'"
     )
-    logger.info("Database pool created")
+    logger.info(f"Database pool created: minsize={DB_MIN_POOL}, maxsize={DB_MAX_POOL}")
+    
+    insert_queue = asyncio.Queue()
+    await fail_stale_queued_searches()
+    insert_worker_task = asyncio.create_task(insert_worker())
+    
+    # One extractor per process: its HTTP session, DNS cache and parse
+    # pool are shared by every search the workers run
+    app.state.extractor = EmailExtractor(
+        DB_CONFIG,
+        max_depth=int(os.getenv('MAX_DEPTH', 3)),
+        timeout=int(os.getenv('TIMEOUT', 30)),
+        max_concurrent=int(os.getenv('MAX_CONCURRENT', 1000)),
+        db_pool_size=EXTRACTOR_DB_POOL,
+        parse_workers=PARSE_WORKERS
+    )
+    await app.state.extractor.initialize()
+    logger.info(
+        f"Extractor created: db pool maxsize={EXTRACTOR_DB_POOL}, "
+        f"parse workers={PARSE_WORKERS}"
+    )
+    
+    extraction_workers = [
+        asyncio.create_task(run_extraction_worker(f"api-{os.getpid()}-{i}"))
+        for i in range(EXTRACTION_WORKERS)
+    ]
+    logger.info(f"Started {EXTRACTION_WORKERS} extraction workers")
 
 
 @app.on_event("shutdown")
 async def shutdown():
     global db_pool
+    # Let the insert worker finish the searches already accepted as
+    # 'queued'; the stale sweep only covers a crash
+    if insert_worker_task:
+        insert_queue.put_nowait(None)
+        await asyncio.gather(insert_worker_task, return_exceptions=True)
+    
+    for task in extraction_workers:
+        task.cancel()
+    await asyncio.gather(*extraction_workers, return_exceptions=True)
+    
+    if getattr(app.state, 'extractor', None):
+        await app.state.extractor.cleanup()
+    
     if db_pool:
         db_pool.close()
         await db_pool.wait_closed()
     
-    # Cleanup active extractors
-    for extractor in active_extractors.values():
-        await extractor.cleanup()
-    
     logger.info("Application shutdown complete")
 
 
 # Helper functions
-async def get_db():
+async def insert_domains(cursor, rows: List[tuple]):
+    """
+    Insert (search_id, domain) rows as multi-row INSERTs.
+    
+    Rows are sent DOMAIN_INSERT_CHUNK at a time, keeping each statement
+    well under max_allowed_packet.
+    """
+    for i in range(0, len(rows), DOMAIN_INSERT_CHUNK):
+        batch = rows[i:i + DOMAIN_INSERT_CHUNK]
+        placeholders = ','.join(["(%s, %s, %s, 'pending')"] * len(batch))
+        params = []
+        for search_id, domain in batch:
+            params += [search_id, domain, f"https://{domain}"]
+        await cursor.execute(
+            f"""INSERT INTO domains (search_id, domain, url, status)
+                VALUES {placeholders}""",
+            params
+        )
+
+
+async def insert_queued_domains(items: List[tuple]):
+    """
+    Insert the domains of queued searches and move them to 'pending'.
+    
+    Runs in one transaction, so a failure leaves none of the searches
+    with a partial domain list.
+    
+    Args:
+        items: (search_id, domains) pairs
+    """
+    search_ids = [search_id for search_id, _ in items]
     async with db_pool.acquire() as conn:
-        yield conn
+        await conn.begin()
+        try:
+            async with conn.cursor() as cursor:
+                await insert_domains(cursor, [
+                    (search_id, domain)
+                    for search_id, domains in items
+                    for domain in domains
+                ])
+                placeholders = ','.join(['%s'] * len(search_ids))
+                await cursor.execute(
+                    f"""UPDATE searches SET status='pending'
+                        WHERE status='queued' AND id IN ({placeholders})""",
+                    search_ids
+                )
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
 
 
-async def run_extraction_worker(search_id: int):
-    """Background worker to process email extraction."""
-    worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+async def fail_searches(search_ids: List[int], reason: str):
+    """Mark searches that are still 'queued' as failed."""
+    placeholders = ','.join(['%s'] * len(search_ids))
+    try:
+        async with db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    f"""UPDATE searches SET status='failed', completed_at=NOW()
+                        WHERE status='queued' AND id IN ({placeholders})""",
+                    search_ids
+                )
+    except Exception as e:
+        logger.error(f"Failed to mark searches {search_ids} failed: {e}")
+        return
     
+    for search_id in search_ids:
+        invalidate_search_cache(search_id)
+    logger.error(f"Searches {search_ids} failed: {reason}")
+
+
+async def fail_stale_queued_searches():
+    """Fail searches left 'queued' by a process that lost its insert queue."""
     try:
-        # Get configuration from environment variables
-        max_depth = int(os.getenv('MAX_DEPTH', 3))
-        timeout = int(os.getenv('TIMEOUT', 30))
-        max_concurrent = int(os.getenv('MAX_CONCURRENT', 1000))
+        async with db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                # create_search sets created_at from the application
+                # clock, so the cutoff is taken from the same UTC clock
+                await cursor.execute(
+                    """UPDATE searches SET status='failed', completed_at=NOW()
+                       WHERE status='queued' AND created_at < %s""",
+                    (datetime.utcnow() - timedelta(seconds=QUEUED_STALE_AFTER),)
+                )
+                if cursor.rowcount:
+                    logger.error(
+                        f"Failed {cursor.rowcount} searches queued for more "
+                        f"than {QUEUED_STALE_AFTER}s without their domains"
+                    )
+    except Exception as e:
+        logger.error(f"Failed to sweep stale queued searches: {e}")
+
+
+async def insert_worker():
+    """
+    Insert the domains of queued searches in batches.
+    
+    Searches queued within INSERT_BATCH_WINDOW of each other share one
+    set of multi-row INSERTs; each is then moved to 'pending' for the
+    extraction workers to claim. If a batch fails, its searches are
+    retried one at a time so a single bad search fails on its own.
+    
+    A None item asks the worker to stop once everything queued before it
+    has been inserted.
+    """
+    last_sweep = time.monotonic()
+    stopping = False
+    while not stopping:
+        if time.monotonic() - last_sweep >= QUEUED_SWEEP_INTERVAL:
+            await fail_stale_queued_searches()
+            last_sweep = time.monotonic()
         
-        extractor = EmailExtractor(
-            DB_CONFIG,
-            max_depth=max_depth,
-            timeout=timeout,
-            max_concurrent=max_concurrent
-        )
-        await extractor.initialize()
-        active_extractors[worker_id] = extractor
+        try:
+            item = await asyncio.wait_for(insert_queue.get(), QUEUED_SWEEP_INTERVAL)
+        except asyncio.TimeoutError:
+            continue
+        
+        items = [item]
+        if item is not None:
+            await asyncio.sleep(INSERT_BATCH_WINDOW)
+        while not insert_queue.empty():
+            items.append(insert_queue.get_nowait())
         
-        logger.info(f"Worker {worker_id} starting search {search_id}")
-        await extractor.process_search(search_id, worker_id)
-        logger.info(f"Worker {worker_id} completed search {search_id}")
+        stopping = None in items
+        items = [item for item in items if item is not None]
+        if not items:
+            continue
         
+        # A failed batch is retried one search at a time
+        batches = [items]
+        done = []
+        while batches:
+            batch = batches.pop()
+            try:
+                await insert_queued_domains(batch)
+                done.extend(search_id for search_id, _ in batch)
+            except Exception as e:
+                if len(batch) > 1:
+                    logger.error(f"Batch insert failed, retrying searches one by one: {e}")
+                    batches.extend([item] for item in batch)
+                else:
+                    await fail_searches([batch[0][0]], f"domain insert failed: {e}")
+        
+        for search_id in done:
+            invalidate_search_cache(search_id)
+        
+        if done:
+            logger.info(f"Inserted domains for {len(done)} queued searches")
+
+
+async def stream_rows(query: str, params: tuple):
+    """Stream query results as a JSON array.
+    
+    Rows are read from an unbuffered server-side cursor and encoded as
+    they arrive, so memory use does not grow with the result size.
+    
+    Args:
+        query: SELECT statement
+        params: Query parameters
+    """
+    yield b"["
+    first = True
+    try:
+        async with db_pool.acquire() as conn:
+            async with conn.cursor(aiomysql.SSDictCursor) as cursor:
+                await cursor.execute(query, params)
+                while True:
+                    rows = await cursor.fetchmany(STREAM_FETCH_SIZE)
+                    if not rows:
+                        break
+                    for row in rows:
+                        if not first:
+                            yield b","
+                        first = False
+                        yield orjson.dumps(row)
     except Exception as e:
-        logger.error(f"Worker {worker_id} error: {str(e)}")
+        # Headers are already sent; the client sees a truncated body
+        logger.error(f"Error streaming rows: {str(e)}")
+        raise
+    yield b"]"
+
+
+def encode_cursor(ts: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row of a page as a cursor."""
+    return base64.urlsafe_b64encode(f"{ts.isoformat()}|{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Returns:
+        (timestamp, id) tuple
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        ts, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(ts), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def conditional_json(request: Request, data: dict) -> Response:
+    """
+    JSON response carrying an ETag of its body.
+    
+    Returns 304 with no body when If-None-Match already names the ETag,
+    so clients polling an unchanged search receive only headers.
+    """
+    body = orjson.dumps(data)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    
+    if_none_match = request.headers.get('if-none-match', '')
+    if etag in (tag.strip() for tag in if_none_match.split(',')):
+        return Response(status_code=304, headers={'ETag': etag})
+    return Response(content=body, media_type='application/json', headers={'ETag': etag})
+
+
+def status_ttl(row: Optional[dict]) -> float:
+    """Cache TTL for a row with a search status; 0 means do not cache."""
+    if not row:
+        return 0
+    if row.get('status') in TERMINAL_STATUSES:
+        return CACHE_TTL_TERMINAL
+    return CACHE_TTL_ACTIVE
+
+
+async def cached_fetch(key: tuple, fetch):
+    """
+    Return the cached value for key, or await fetch() and cache it.
+    
+    fetch returns a (value, ttl) tuple. Concurrent misses on the same key
+    share one fetch: the first caller registers a Future in
+    pending_fetches and the others await it instead of querying MySQL.
+    """
+    entry = read_cache.get(key)
+    if entry is not None:
+        return entry[1]
+    
+    pending = pending_fetches.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+    
+    pending = asyncio.get_running_loop().create_future()
+    pending_fetches[key] = pending
+    try:
+        value, ttl = await fetch()
+        if ttl > 0:
+            read_cache[key] = (ttl, value)
+        pending.set_result(value)
+        return value
+    except Exception as e:
+        pending.set_exception(e)
+        raise
     finally:
-        if worker_id in active_extractors:
-            await active_extractors[worker_id].cleanup()
-            del active_extractors[worker_id]
+        pending_fetches.pop(key, None)
+        if not pending.done():
+            # The first caller was cancelled; fail the waiters rather
+            # than leave them hanging
+            pending.set_exception(RuntimeError(f"Fetch of {key} was cancelled"))
+        # Mark any exception retrieved, so a miss without waiters is not
+        # logged as "exception was never retrieved"
+        pending.exception()
+
+
+def invalidate_search_cache(search_id: int):
+    """Drop cached reads for a search and all cached search listings."""
+    for key in list(read_cache.keys()):
+        if key[0] == 'searches' or key[1] == search_id:
+            read_cache.pop(key, None)
+
+
+async def run_extraction_worker(worker_id: str):
+    """Persistent worker: claim pending searches and process them in turn."""
+    extractor = app.state.extractor
+    try:
+        while True:
+            try:
+                search_id = await extractor.claim_pending_search()
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed to claim a search: {str(e)}")
+                search_id = None
+            
+            if search_id is None:
+                await asyncio.sleep(WORKER_POLL_INTERVAL)
+                continue
+            
+            logger.info(f"Worker {worker_id} starting search {search_id}")
+            active_searches[worker_id] = search_id
+            invalidate_search_cache(search_id)
+            try:
+                await extractor.process_search(search_id, worker_id)
+                logger.info(f"Worker {worker_id} completed search {search_id}")
+            except Exception as e:
+                logger.error(f"Worker {worker_id} error on search {search_id}: {str(e)}")
+            finally:
+                active_searches.pop(worker_id, None)
+                invalidate_search_cache(search_id)
+        
+    except Exception as e:
+        logger.error(f"Worker {worker_id} error: {str(e)}")
 
 
 # API Endpoints
@@ -178,89 +596,121 @@ async def root():
     return {
         "status": "running",
         "service": "Email Extraction API",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "active_searches": len(active_searches)
     }
 
 
 @app.post("/api/searches", response_model=SearchResponse, status_code=201)
 async def create_search(
-    search_data: SearchCreate,
-    background_tasks: BackgroundTasks,
-    conn=Depends(get_db)
+    search_data: SearchCreate
 ):
     """Create a new email extraction search."""
+    # Large searches return before their domains are inserted
+    queued = len(search_data.domains) >= ASYNC_INSERT_MIN_DOMAINS
+    status = 'queued' if queued else 'pending'
+    # Set here rather than by the column default so the response can be
+    # built without reading the row back. UTC, like NOW() on the pool's
+    # sessions.
+    created_at = datetime.utcnow().replace(microsecond=0)
+    
     try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            # Create search record
-            await cursor.execute(
-                """INSERT INTO searches (batch_name, total_domains, status)
-                   VALUES (%s, %s, 'pending')""",
-                (search_data.batch_name, len(search_data.domains))
-            )
-            search_id = cursor.lastrowid
-            
-            # Insert domains
-            domain_values = [
-                (search_id, domain, f"https://{domain}")
-                for domain in search_data.domains
-            ]
-            
-            await cursor.executemany(
-                """INSERT INTO domains (search_id, domain, url, status)
-                   VALUES (%s, %s, %s, 'pending')""",
-                domain_values
-            )
-            
-            # Get search details
-            await cursor.execute(
-                """SELECT id, batch_name, total_domains, status, 
-                   created_at, started_at, completed_at
-                   FROM searches WHERE id=%s""",
-                (search_id,)
-            )
-            search = await cursor.fetchone()
+        async with db_pool.acquire() as conn:
+            # One transaction: a single commit for the search and its
+            # domains, and workers never see the search without them
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    # Create search record
+                    await cursor.execute(
+                        """INSERT INTO searches 
+                           (batch_name, total_domains, status, created_at)
+                           VALUES (%s, %s, %s, %s)""",
+                        (search_data.batch_name, len(search_data.domains),
+                         status, created_at)
+                    )
+                    search_id = cursor.lastrowid
+                    
+                    # Insert domains; queued searches get theirs from insert_worker
+                    if not queued:
+                        await insert_domains(
+                            cursor, [(search_id, domain) for domain in search_data.domains]
+                        )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
         
-        # Start background extraction
-        background_tasks.add_task(run_extraction_worker, search_id)
+        if queued:
+            insert_queue.put_nowait((search_id, search_data.domains))
         
         logger.info(f"Created search {search_id} with {len(search_data.domains)} domains")
         
-        return SearchResponse(**search)
+        return SearchResponse(
+            search_id=search_id,
+            batch_name=search_data.batch_name,
+            total_domains=len(search_data.domains),
+            status=status,
+            created_at=created_at,
+            started_at=None,
+            completed_at=None
+        )
         
     except Exception as e:
         logger.error(f"Error creating search: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/searches", response_model=List[SearchResponse])
+@app.get(
+    "/api/searches",
+    response_model=None,
+    responses={200: {"model": List[SearchResponse]}}
+)
 async def list_searches(
     status: Optional[str] = None,
     limit: int = 100,
-    offset: int = 0,
-    conn=Depends(get_db)
+    cursor: Optional[str] = None
 ):
-    """List all searches with optional status filter."""
-    try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            if status:
-                await cursor.execute(
-                    """SELECT id, batch_name, total_domains, status,
-                       created_at, started_at, completed_at
-                       FROM searches WHERE status=%s
-                       ORDER BY created_at DESC LIMIT %s OFFSET %s""",
-                    (status, limit, offset)
-                )
-            else:
-                await cursor.execute(
-                    """SELECT id, batch_name, total_domains, status,
-                       created_at, started_at, completed_at
-                       FROM searches
-                       ORDER BY created_at DESC LIMIT %s OFFSET %s""",
-                    (limit, offset)
+    """
+    List all searches with optional status filter.
+    
+    Results are paged by (created_at, id), newest first. When more rows
+    may follow, the X-Next-Cursor header holds the cursor for the next page.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    
+    async def fetch():
+        conditions, params = [], []
+        if status:
+            conditions.append("status=%s")
+            params.append(status)
+        if after:
+            conditions.append("(created_at < %s OR (created_at = %s AND id < %s))")
+            params.extend([after[0], after[0], after[1]])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        async with db_pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as db_cursor:
+                await db_cursor.execute(
+                    f"""SELECT id as search_id, batch_name, total_domains, status,
+                        created_at, started_at, completed_at
+                        FROM searches {where}
+                        ORDER BY created_at DESC, id DESC LIMIT %s""",
+                    (*params, limit)
                 )
-            
-            searches = await cursor.fetchall()
-            return [SearchResponse(**s) for s in searches]
+                return await db_cursor.fetchall(), CACHE_TTL_ACTIVE
+    
+    try:
+        searches = await cached_fetch(('searches', status, limit, cursor), fetch)
+        headers = {}
+        if searches and len(searches) == limit:
+            last = searches[-1]
+            headers['X-Next-Cursor'] = encode_cursor(
+                last['created_at'], last['search_id']
+            )
+        # Returned as a response so FastAPI does not run jsonable_encoder
+        # over every row first
+        return ORJSONResponse(searches, headers=headers)
             
     except Exception as e:
         logger.error(f"Error listing searches: {str(e)}")
@@ -268,22 +718,27 @@ async def list_searches(
 
 
 @app.get("/api/searches/{search_id}", response_model=SearchResponse)
-async def get_search(search_id: int, conn=Depends(get_db)):
+async def get_search(search_id: int, request: Request):
     """Get details of a specific search."""
+    async def fetch():
+        async with db_pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(
+                    """SELECT id as search_id, batch_name, total_domains, status,
+                       created_at, started_at, completed_at
+                       FROM searches WHERE id=%s""",
+                    (search_id,)
+                )
+                search = await cursor.fetchone()
+                return search, status_ttl(search)
+    
     try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute(
-                """SELECT id, batch_name, total_domains, status,
-                   created_at, started_at, completed_at
-                   FROM searches WHERE id=%s""",
-                (search_id,)
-            )
-            search = await cursor.fetchone()
-            
-            if not search:
-                raise HTTPException(status_code=404, detail="Search not found")
-            
-            return SearchResponse(**search)
+        search = await cached_fetch(('search', search_id), fetch)
+        
+        if not search:
+            raise HTTPException(status_code=404, detail="Search not found")
+        
+        return conditional_json(request, search)
             
     except HTTPException:
         raise
@@ -293,32 +748,30 @@ async def get_search(search_id: int, conn=Depends(get_db)):
 
 
 @app.get("/api/searches/{search_id}/statistics", response_model=SearchStatistics)
-async def get_search_statistics(search_id: int, conn=Depends(get_db)):
+async def get_search_statistics(search_id: int, request: Request):
     """Get statistics for a specific search."""
+    async def fetch():
+        async with db_pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(
+                    """SELECT id as search_id, status, total_domains,
+                       domains_completed, domains_failed,
+                       total_pages_crawled, total_emails_found,
+                       TIMESTAMPDIFF(SECOND, started_at,
+                                     COALESCE(completed_at, NOW())) as duration_seconds
+                       FROM searches WHERE id=%s""",
+                    (search_id,)
+                )
+                stats = await cursor.fetchone()
+                return stats, status_ttl(stats)
+    
     try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute(
-                """SELECT 
-                   s.id as search_id,
-                   s.total_domains,
-                   SUM(CASE WHEN d.status='completed' THEN 1 ELSE 0 END) as domains_completed,
-                   SUM(CASE WHEN d.status='failed' THEN 1 ELSE 0 END) as domains_failed,
-                   SUM(d.pages_crawled) as total_pages_crawled,
-                   SUM(d.emails_found) as total_emails_found,
-                   TIMESTAMPDIFF(SECOND, s.started_at, 
-                                 COALESCE(s.completed_at, NOW())) as duration_seconds
-                   FROM searches s
-                   LEFT JOIN domains d ON s.id = d.search_id
-                   WHERE s.id=%s
-                   GROUP BY s.id""",
-                (search_id,)
-            )
-            stats = await cursor.fetchone()
-            
-            if not stats:
-                raise HTTPException(status_code=404, detail="Search not found")
-            
-            return SearchStatistics(**stats)
+        stats = await cached_fetch(('statistics', search_id), fetch)
+        
+        if not stats:
+            raise HTTPException(status_code=404, detail="Search not found")
+        
+        return conditional_json(request, SearchStatistics(**stats).model_dump())
             
     except HTTPException:
         raise
@@ -327,124 +780,146 @@ async def get_search_statistics(search_id: int, conn=Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/searches/{search_id}/domains", response_model=List[DomainResponse])
+@app.get(
+    "/api/searches/{search_id}/domains",
+    response_model=None,
+    responses={200: {"model": List[DomainResponse]}}
+)
 async def get_search_domains(
     search_id: int,
     status: Optional[str] = None,
     limit: int = 100,
-    offset: int = 0,
-    conn=Depends(get_db)
+    cursor: Optional[str] = None
 ):
-    """Get domains for a specific search."""
-    try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            if status:
-                await cursor.execute(
-                    """SELECT id as domain_id, domain, status, 
-                       pages_crawled, emails_found, error_message, updated_at
-                       FROM domains WHERE search_id=%s AND status=%s
-                       ORDER BY updated_at DESC LIMIT %s OFFSET %s""",
-                    (search_id, status, limit, offset)
-                )
-            else:
-                await cursor.execute(
-                    """SELECT id as domain_id, domain, status,
-                       pages_crawled, emails_found, error_message, updated_at
-                       FROM domains WHERE search_id=%s
-                       ORDER BY updated_at DESC LIMIT %s OFFSET %s""",
-                    (search_id, limit, offset)
+    """
+    Get domains for a specific search.
+    
+    Results are paged by (updated_at, id), most recently updated first.
+    When more rows may follow, the X-Next-Cursor header holds the cursor
+    for the next page.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    
+    async def fetch():
+        conditions, params = ["search_id=%s"], [search_id]
+        if status:
+            conditions.append("status=%s")
+            params.append(status)
+        if after:
+            conditions.append("(updated_at < %s OR (updated_at = %s AND id < %s))")
+            params.extend([after[0], after[0], after[1]])
+        
+        async with db_pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as db_cursor:
+                await db_cursor.execute(
+                    f"""SELECT id as domain_id, domain, status,
+                        pages_crawled, emails_found, error_message, updated_at
+                        FROM domains WHERE {' AND '.join(conditions)}
+                        ORDER BY updated_at DESC, id DESC LIMIT %s""",
+                    (*params, limit)
                 )
-            
-            domains = await cursor.fetchall()
-            return [DomainResponse(**d) for d in domains]
+                return await db_cursor.fetchall(), CACHE_TTL_ACTIVE
+    
+    try:
+        domains = await cached_fetch(('domains', search_id, status, limit, cursor), fetch)
+        headers = {}
+        if domains and len(domains) == limit:
+            last = domains[-1]
+            headers['X-Next-Cursor'] = encode_cursor(
+                last['updated_at'], last['domain_id']
+            )
+        return ORJSONResponse(domains, headers=headers)
             
     except Exception as e:
         logger.error(f"Error getting domains: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/domains/{domain_id}/emails", response_model=List[EmailResponse])
-async def get_domain_emails(domain_id: int, conn=Depends(get_db)):
+@app.get(
+    "/api/domains/{domain_id}/emails",
+    response_model=None,
+    responses={200: {"model": List[EmailResponse]}}
+)
+async def get_domain_emails(
+    domain_id: int,
+    limit: int = Query(EMAIL_RESULT_MAX, ge=1, le=EMAIL_RESULT_MAX),
+    offset: int = Query(0, ge=0)
+):
     """Get all emails extracted from a specific domain."""
-    try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute(
-                """SELECT 
-                   e.id as email_id,
-                   d.domain,
-                   p.url as page_url,
-                   e.raw_email,
-                   e.normalized_email,
-                   e.extracted_at
-                   FROM emails e
-                   JOIN domains d ON e.domain_id = d.id
-                   JOIN pages p ON e.page_id = p.id
-                   WHERE e.domain_id=%s
-                   ORDER BY e.extracted_at DESC""",
-                (domain_id,)
-            )
-            
-            emails = await cursor.fetchall()
-            return [EmailResponse(**e) for e in emails]
-            
-    except Exception as e:
-        logger.error(f"Error getting emails: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(
+        stream_rows(
+            """SELECT 
+               e.id as email_id,
+               d.domain,
+               p.url as page_url,
+               e.raw_email,
+               e.normalized_email,
+               e.extracted_at
+               FROM emails e
+               JOIN domains d ON e.domain_id = d.id
+               JOIN pages p ON e.page_id = p.id
+               WHERE e.domain_id=%s
+               ORDER BY e.extracted_at DESC
+               LIMIT %s OFFSET %s""",
+            (domain_id, limit, offset)
+        ),
+        media_type="application/json"
+    )
 
 
-@app.get("/api/searches/{search_id}/emails", response_model=List[EmailResponse])
+@app.get(
+    "/api/searches/{search_id}/emails",
+    response_model=None,
+    responses={200: {"model": List[EmailResponse]}}
+)
 async def get_search_emails(
     search_id: int,
-    limit: int = 1000,
-    offset: int = 0,
-    conn=Depends(get_db)
+    limit: int = Query(1000, ge=1, le=EMAIL_RESULT_MAX),
+    offset: int = Query(0, ge=0)
 ):
     """Get all emails extracted in a search."""
-    try:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute(
-                """SELECT 
-                   e.id as email_id,
-                   d.domain,
-                   p.url as page_url,
-                   e.raw_email,
-                   e.normalized_email,
-                   e.extracted_at
-                   FROM emails e
-                   JOIN domains d ON e.domain_id = d.id
-                   JOIN pages p ON e.page_id = p.id
-                   WHERE d.search_id=%s
-                   ORDER BY e.extracted_at DESC
-                   LIMIT %s OFFSET %s""",
-                (search_id, limit, offset)
-            )
-            
-            emails = await cursor.fetchall()
-            return [EmailResponse(**e) for e in emails]
-            
-    except Exception as e:
-        logger.error(f"Error getting emails: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(
+        stream_rows(
+            """SELECT 
+               e.id as email_id,
+               d.domain,
+               p.url as page_url,
+               e.raw_email,
+               e.normalized_email,
+               e.extracted_at
+               FROM emails e
+               JOIN domains d ON e.domain_id = d.id
+               JOIN pages p ON e.page_id = p.id
+               WHERE d.search_id=%s
+               ORDER BY e.extracted_at DESC
+               LIMIT %s OFFSET %s""",
+            (search_id, limit, offset)
+        ),
+        media_type="application/json"
+    )
 
 
 @app.patch("/api/searches/{search_id}/pause")
-async def pause_search(search_id: int, conn=Depends(get_db)):
+async def pause_search(search_id: int):
     """Pause a running search."""
     try:
-        async with conn.cursor() as cursor:
-            await cursor.execute(
-                """UPDATE searches SET status='paused' 
-                   WHERE id=%s AND status='in_progress'""",
-                (search_id,)
-            )
-            
-            if cursor.rowcount == 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Search not found or not in progress"
+        async with db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """UPDATE searches SET status='paused' 
+                       WHERE id=%s AND status='in_progress'""",
+                    (search_id,)
                 )
-            
-            return {"message": "Search paused", "search_id": search_id}
+                updated = cursor.rowcount
+        
+        if updated == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Search not found or not in progress"
+            )
+        
+        invalidate_search_cache(search_id)
+        return {"message": "Search paused", "search_id": search_id}
             
     except HTTPException:
         raise
@@ -455,29 +930,29 @@ async def pause_search(search_id: int, conn=Depends(get_db)):
 
 @app.patch("/api/searches/{search_id}/resume")
 async def resume_search(
-    search_id: int,
-    background_tasks: BackgroundTasks,
-    conn=Depends(get_db)
+    search_id: int
 ):
     """Resume a paused search."""
     try:
-        async with conn.cursor() as cursor:
-            await cursor.execute(
-                """UPDATE searches SET status='in_progress' 
-                   WHERE id=%s AND status='paused'""",
-                (search_id,)
-            )
-            
-            if cursor.rowcount == 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Search not found or not paused"
+        async with db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(
+                    """UPDATE searches SET status='pending' 
+                       WHERE id=%s AND status='paused'""",
+                    (search_id,)
                 )
-            
-            # Restart background extraction
-            background_tasks.add_task(run_extraction_worker, search_id)
-            
-            return {"message": "Search resumed", "search_id": search_id}
+                updated = cursor.rowcount
+        
+        if updated == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Search not found or not paused"
+            )
+        
+        invalidate_search_cache(search_id)
+        
+        # An extraction worker picks the search up again
+        return {"message": "Search resumed", "search_id": search_id}
             
     except HTTPException:
         raise
@@ -487,26 +962,27 @@ async def resume_search(
 
 
 @app.delete("/api/searches/{search_id}")
-async def cancel_search(search_id: int, conn=Depends(get_db)):
+async def cancel_search(search_id: int):
     """Cancel a search and mark as cancelled."""
     try:
-        async with conn.cursor() as cursor:
-            await cursor.execute(
-                """UPDATE searches SET status='cancelled' WHERE id=%s""",
-                (search_id,)
-            )
-            
-            if cursor.rowcount == 0:
-                raise HTTPException(status_code=404, detail="Search not found")
-            
-            # Unlock any locked domains
-            await cursor.execute(
-                """UPDATE domains SET worker_id=NULL, locked_at=NULL
-                   WHERE search_id=%s AND status='crawling'""",
-                (search_id,)
-            )
-            
-            return {"message": "Search cancelled", "search_id": search_id}
+        async with db_pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                # Cancel and unlock any locked domains in one statement
+                await cursor.execute(
+                    """UPDATE searches s
+                       LEFT JOIN domains d
+                       ON d.search_id = s.id AND d.status='crawling'
+                       SET s.status='cancelled', d.worker_id=NULL, d.locked_at=NULL
+                       WHERE s.id=%s""",
+                    (search_id,)
+                )
+                updated = cursor.rowcount
+        
+        if updated == 0:
+            raise HTTPException(status_code=404, detail="Search not found")
+        
+        invalidate_search_cache(search_id)
+        return {"message": "Search cancelled", "search_id": search_id}
             
     except HTTPException:
         raise
@@ -517,4 +993,12 @@ async def cancel_search(search_id: int, conn=Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=WEB_CONCURRENCY,
+        log_level="info"
+    )
\ No newline at end of file
@@ -0,0 +1,8 @@
+# Make the flat module layout used in the container importable
+# (core.py and api.py are copied side by side into /app)
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'definition'))
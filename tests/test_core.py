@@ -0,0 +1,136 @@
+# Tests for email extraction in core.EmailExtractor
+
+from urllib.parse import urljoin, urlparse
+
+import pytest
+from core import EmailExtractor
+
+
+@pytest.fixture(scope='module')
+def extractor():
+    # No initialize(): extraction needs neither the database nor HTTP
+    return EmailExtractor({})
+
+
+@pytest.mark.parametrize('html, expected', [
+    ('<p>john [at] example [dot] com</p>', {'john@example.com'}),
+    ('<p>Jane [AT] example [DOT] org</p>', {'Jane@example.org'}),
+    ('<p>jane (at) example (dot) org</p>', {'jane@example.org'}),
+    ('<p>bob (a) example (dot) net</p>', {'bob@example.net'}),
+    ('<p>alice @ example . com</p>', {'alice@example.com'}),
+])
+def test_obfuscated_emails(extractor, html, expected):
+    assert extractor.extract_emails_from_html(html) == expected
+
+
+@pytest.mark.parametrize('html', [
+    '<p>john&#64;example.com</p>',
+    '<p>john&#064;example.com</p>',
+    '<p>john&#x40;example.com</p>',
+    '<p>john&#X40;example.com</p>',
+    '<p>john&commat;example.com</p>',
+    '<a href="mailto:john&#64;example.com">Mail us</a>',
+])
+def test_entity_encoded_emails(extractor, html):
+    assert extractor.extract_emails_from_html(html) == {'john@example.com'}
+
+
+@pytest.mark.parametrize('html', [
+    '<p>See clause (a) above. The parties agree.</p>',
+    '<p>Meet us (at) noon. Lunch is provided.</p>',
+    '<p>Reply [at] once. Thanks</p>',
+    '<p>user (at) example [dot] com</p>',
+])
+def test_obfuscation_separators_do_not_mix(extractor, html):
+    assert extractor.extract_emails_from_html(html) == set()
+
+
+@pytest.mark.parametrize('href, kept', [
+    ('https://example.com/contact', True),
+    ('/about?img=logo.png', True),
+    ('/files/report.pdf', False),
+    ('/images/logo.PNG?v=2', False),
+    ('https://example.com/files/report.pdf#page=2', False),
+    ('//example.com/app.js', False),
+])
+def test_extract_links_skips_assets_by_path(extractor, href, kept):
+    html = f'<a href="{href}">link</a>'
+    links = extractor.extract_links(html, 'https://example.com/', 'example.com')
+    assert bool(links) == kept
+
+
+@pytest.mark.parametrize('href, excluded', [
+    ('https://example.zip', False),
+    ('https://foo.mov/', False),
+    ('//example.zip', False),
+    ('/page?img=a.png', False),
+    ('file.pdf/next', False),
+    ('https://a.zip/file.pdf', True),
+    ('//cdn.example.com/a.PNG?x=1', True),
+    ('doc.pdf#p2', True),
+    ('../setup.deb', True),
+])
+def test_excluded_link_pattern_checks_path_only(href, excluded):
+    assert bool(EmailExtractor.EXCLUDED_LINK_PATTERN.match(href)) == excluded
+
+
+@pytest.mark.parametrize('email, expected', [
+    (' John.Doe@Example.com. ', 'john.doe@example.com'),
+    ('<info@example.co.uk>', 'info@example.co.uk'),
+    ('a@xn--bcher-kva.de', 'a@bücher.de'),
+    ('a@bücher.de', 'a@bücher.de'),
+])
+def test_normalize_email(extractor, email, expected):
+    assert extractor.normalize_email(email) == expected
+
+
+@pytest.mark.parametrize('email', [
+    'a@ab--cd.com',
+    'a@xn--abc.com',
+    'a@b.test',
+    'user@localhost',
+    'not-an-email',
+])
+def test_normalize_email_rejects_invalid(extractor, email):
+    assert extractor.normalize_email(email) is None
+
+
+@pytest.mark.parametrize('base_url', [
+    'https://example.com',
+    'https://example.com/',
+    'https://example.com/a/b',
+    'https://example.com/a/b/',
+    'https://example.com/a/b;p?q=1#f',
+    'https://example.com/a//b',
+    'https://example.com/a/../b/c',
+])
+@pytest.mark.parametrize('href', [
+    'page', '/abs', 'a/b/', 'x?y', 'x#y', '?q=1', '/',
+    './x', '../x', '../../../x', 'a/./b', 'a/../b', '.', '..',
+    'x;p', '/x;p/y', 'a//b', '/x//y', '//',
+    '//other.example.com/p', '//example.com', '//example.com/a/./b',
+    'https://example.com', 'https://Example.com/x?y#z',
+    'https://example.com/a/../b', 'http://example.com/a/../b',
+    'ftp://example.com/x', 'x:y', ' x', 'x y', '\\x',
+])
+def test_resolve_link_matches_urljoin(extractor, base_url, href):
+    expected = urlparse(urljoin(base_url, href))
+    links = extractor.extract_links(
+        f'<a href="{href}">link</a>', base_url, 'example.com'
+    )
+    if extractor.is_valid_url(expected.geturl(), 'example.com'):
+        assert links == {
+            f"{expected.scheme}://{expected.netloc}{expected.path}"
+        }
+    else:
+        assert not links
+    
+    base = urlparse(base_url)
+    if not extractor.REWRITTEN_PATH_PATTERN.search(base.path):
+        base_dir = base.path[:base.path.rfind('/') + 1] or '/'
+        parts = extractor._resolve_link(
+            href, base.scheme, base.netloc, base.path, base_dir
+        )
+        assert parts in (
+            None, (expected.scheme, expected.netloc, expected.path)
+        )